@@ -4,15 +4,51 @@
 
 # --- 標準ライブラリ ---
 import logging
-from typing import Any
+from typing import Any, Callable
 
 # --- 自作モジュール ---
 from utils.pipeline import run_extract_pipeline, run_extract_range_pipeline
-from utils.init.load_masters import initialize_master_tables
 
 # --- ロガー初期化 ---
 logger = logging.getLogger(__name__)
 
+# ----------------------------
+# モード別の処理
+# ----------------------------
+
+
+def _run_etl(kwargs: dict[str, Any]) -> None:
+    """最新の株価を取得し、ETLパイプラインを実行する。"""
+    return run_extract_pipeline(kwargs.get("tickers", []))
+
+
+def _run_etl_range(kwargs: dict[str, Any]) -> None:
+    """指定された日付範囲で株価を取得し、ETLパイプラインを実行する。"""
+    return run_extract_range_pipeline(
+        kwargs.get("tickers", []),
+        kwargs.get("start_date"),
+        kwargs.get("end_date"),
+    )
+
+
+def _run_init_master(kwargs: dict[str, Any]) -> None:
+    """マスターデータを初期ロードする。"""
+    # 実行頻度が低いため、通常のETL実行時には読み込まないよう遅延 import する
+    from utils.init.load_masters import initialize_master_tables
+
+    return initialize_master_tables(
+        bucket_name=kwargs.get("bucket_name"),
+        dataset_name=kwargs.get("dataset_name"),
+    )
+
+
+# mode → 処理関数の対応表
+MODE_HANDLERS: dict[str, Callable[[dict[str, Any]], None]] = {
+    "etl": _run_etl,
+    "etl_range": _run_etl_range,
+    "init_master": _run_init_master,
+}
+
 
 def handle_request(mode: str, **kwargs: Any) -> None:
     """
@@ -29,22 +65,9 @@ def handle_request(mode: str, **kwargs: Any) -> None:
     """
     logger.info(f"[start] handle_request mode={mode}")
 
-    if mode == "etl":
-        return run_extract_pipeline(kwargs.get("tickers", []))
-
-    elif mode == "etl_range":
-        return run_extract_range_pipeline(
-            kwargs.get("tickers", []),
-            kwargs.get("start_date"),
-            kwargs.get("end_date"),
-        )
-
-    elif mode == "init_master":
-        return initialize_master_tables(
-            bucket_name=kwargs.get("bucket_name"),
-            dataset_name=kwargs.get("dataset_name"),
-        )
-
-    else:
+    handler = MODE_HANDLERS.get(mode)
+    if handler is None:
         logger.error(f"[error] Invalid mode specified: {mode}")
         raise ValueError(f"Invalid mode specified: {mode}")
+
+    return handler(kwargs)
@@ -24,9 +24,22 @@ from utils.init.get_tickers import get_tickers
 BUCKET_NAME: str = os.environ.get("GCS_BUCKET_NAME", "yfinance-project-bucket")
 DATASET_ID: str = os.environ.get("BIGQUERY_DATASET_ID", "yfinance_analytics")
 
-# --- Cloud Loggingの初期化 ---
-cloud_logging.Client().setup_logging()
+# --- ロガー設定（Cloud Loggingの初期化は初回リクエスト時に行う） ---
 logger = logging.getLogger(__name__)
+_cloud_logging_initialized = False
+
+
+def _setup_cloud_logging() -> None:
+    """
+    Cloud Logging の初期化を、インスタンスごとに初回呼び出し時のみ実行する。
+    ※ import 時に認証・クライアント生成を行わず、コールドスタートを短縮するため。
+    """
+    global _cloud_logging_initialized
+    if _cloud_logging_initialized:
+        return
+
+    cloud_logging.Client().setup_logging()
+    _cloud_logging_initialized = True
 
 
 def etl_dispatcher(request: Request) -> Tuple[str, int]:
@@ -40,6 +53,7 @@ def etl_dispatcher(request: Request) -> Tuple[str, int]:
         Tuple[str, int]: 結果メッセージとHTTPステータスコード
     """
     try:
+        _setup_cloud_logging()
         logger.info("[start] ETL function triggered")
 
         # --- リクエスト受信・パラメータ抽出 ---
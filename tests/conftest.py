@@ -0,0 +1,28 @@
+"""
+テスト共通の設定
+
+- モジュール内でキャッシュしている GCP クライアント・スキーマ定義をテストごとにクリアする
+- これにより、各テストで mock.patch した Client が確実に呼び出される
+"""
+
+import pytest
+import utils.logger
+from utils.etl import load_to_bigquery, save_json_to_gcs
+
+
+@pytest.fixture(autouse=True)
+def clear_cached_clients():
+    """
+    キャッシュ済みクライアントを破棄し、テスト間で mock が共有されないようにする。
+    """
+    cached_getters = [
+        load_to_bigquery._get_bq_client,
+        load_to_bigquery._get_storage_client,
+        load_to_bigquery._get_write_client,
+        load_to_bigquery._fetch_schema,
+        save_json_to_gcs._get_storage_client,
+        utils.logger._get_storage_client,
+    ]
+    for getter in cached_getters:
+        getter.cache_clear()
+    yield
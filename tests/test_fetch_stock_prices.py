@@ -4,12 +4,17 @@ fetch_stock_prices_latest() のテストモジュール
 - リストが返るか
 - 必須キーを含むか
 - 市場休場日（週末・祝日など）をスキップするか
+- yf.download による一括取得が銘柄ごとに分解されるか（mock使用）
+- 一括取得の失敗時に銘柄ごとの取得へ切り替わるか（mock使用）
 - ※エラーハンドリングのテストは含まず、正常データ取得時の挙動を検証
 """
 
 import pytest
+import pandas as pd
 from datetime import datetime
+from unittest import mock
 from utils.etl.fetch_stock_prices import (
+    fetch_stock_prices,
     fetch_stock_prices_latest,
     fetch_stock_prices_by_date_range,
 )
@@ -78,3 +83,64 @@ def test_fetch_stock_prices_by_date_range_returns_data():
     ]
     for key in required_keys:
         assert key in sample, f"'{key}' キーが存在しません"
+
+
+@mock.patch("utils.etl.fetch_stock_prices.yf.download")
+def test_fetch_stock_prices_downloads_all_tickers_at_once(mock_download):
+    """
+    fetch_stock_prices() が yf.download を 1 回だけ呼び出し、銘柄ごとに分解するかを検証する。
+    """
+    index = pd.DatetimeIndex(["2025-08-01", "2025-08-04"], name="Date")
+    ohlcv = {
+        "Open": [100.0, 101.0],
+        "High": [110.0, 111.0],
+        "Low": [90.0, 91.0],
+        "Close": [105.0, 106.0],
+        "Volume": [100000, 100001],
+    }
+    mock_download.return_value = pd.concat(
+        {
+            "AAPL": pd.DataFrame(ohlcv, index=index),
+            "MSFT": pd.DataFrame(ohlcv, index=index),
+        },
+        axis=1,
+    )
+
+    results = fetch_stock_prices(
+        ["AAPL", "MSFT", "XXXX"], "2025-08-01", "2025-08-04"
+    )
+
+    mock_download.assert_called_once()
+    assert len(results) == 4
+    assert {r["ticker"] for r in results} == {"AAPL", "MSFT"}
+    assert results[0]["date"] == "2025-08-01"
+    assert "created_at" in results[0]
+
+
+@mock.patch("utils.etl.fetch_stock_prices.yf.Ticker")
+@mock.patch(
+    "utils.etl.fetch_stock_prices.yf.download",
+    side_effect=Exception("download failed"),
+)
+def test_fetch_stock_prices_falls_back_to_per_ticker(
+    mock_download, mock_ticker
+):
+    """
+    yf.download が失敗した場合、銘柄ごとの取得に切り替わるかを検証する。
+    """
+    index = pd.DatetimeIndex(["2025-08-01"], name="Date")
+    mock_ticker.return_value.history.return_value = pd.DataFrame(
+        {
+            "Open": [100.0],
+            "High": [110.0],
+            "Low": [90.0],
+            "Close": [105.0],
+            "Volume": [100000],
+        },
+        index=index,
+    )
+
+    results = fetch_stock_prices(["AAPL", "MSFT"], "2025-08-01", "2025-08-01")
+
+    assert mock_ticker.call_count == 2
+    assert [r["ticker"] for r in results] == ["AAPL", "MSFT"]
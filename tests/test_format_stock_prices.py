@@ -91,3 +91,30 @@ def test_format_stock_prices_by_date_groups_by_date(raw_fetch_result):
     ]
     for key in expected_keys:
         assert key in result
+
+
+def test_format_stock_prices_by_date_splits_multiple_dates():
+    """
+    format_stock_prices_by_date() が 複数日・複数銘柄の入力を日付ごとに正しく振り分けるかを検証する。
+    """
+    raw = [
+        {
+            "ticker": ticker,
+            "date": date,
+            "Open": 1.0,
+            "High": 1.0,
+            "Low": 1.0,
+            "Close": 1.0,
+            "Volume": 1,
+        }
+        for ticker in ["AAPL", "MSFT"]
+        for date in ["2025-08-02", "2025-08-01"]
+    ]
+
+    grouped = format_stock_prices_by_date(raw)
+
+    # 日付昇順で、各日付に該当するレコードのみが銘柄順に含まれること
+    assert list(grouped) == ["2025-08-01", "2025-08-02"]
+    for date, records in grouped.items():
+        assert [r["date"] for r in records] == [date, date]
+        assert [r["ticker_id"] for r in records] == ["AAPL", "MSFT"]
@@ -1,7 +1,8 @@
 """
 load_to_bigquery モジュールのテスト
 
-- GCS → BigQuery へのロード処理（load_temp_table）
+- GCS → BigQuery へのロード処理（load_temp_table、複数ファイルの一括ロード含む）
+- レコード → BigQuery への直接ロード処理（load_temp_table_from_records）
 - 一時テーブル → 本テーブルへの MERGE（merge_temp_table_to_bq）
 - 一時テーブルの削除処理（delete_temp_table）
 
@@ -11,6 +12,8 @@ load_to_bigquery モジュールのテスト
 from unittest import mock
 from utils.etl.load_to_bigquery import (
     load_temp_table,
+    load_temp_table_from_records,
+    load_temp_table_via_storage_write_api,
     merge_temp_table_to_bq,
     delete_temp_table,
 )
@@ -57,6 +60,193 @@ def test_load_temp_table_calls_load_from_uri(
     assert "dummy_table" in args[1]
 
 
+@mock.patch("utils.etl.load_to_bigquery.bigquery.Client")
+@mock.patch("utils.etl.load_to_bigquery.storage.Client")
+def test_load_temp_table_loads_multiple_files_in_one_job(
+    mock_storage_client, mock_bq_client
+):
+    """
+    load_temp_table() に複数パスを渡した場合、1 回のロードジョブにまとめるかを検証する。
+    """
+    mock_blob = mock.Mock()
+    mock_blob.download_as_text.return_value = (
+        '[{"name": "date", "field_type": "DATE"}]'
+    )
+    mock_storage_client.return_value.bucket.return_value.blob.return_value = (
+        mock_blob
+    )
+    mock_bq = mock.Mock()
+    mock_bq_client.return_value = mock_bq
+
+    # 実行
+    load_temp_table(
+        bucket_name="dummy-bucket",
+        json_path=["day1.ndjson", "day2.ndjson"],
+        dataset_id="dummy_dataset",
+        table_id="dummy_table",
+        schema_blob_path="schema/stock_prices_schema.json",
+    )
+
+    # 検証：URI のリストで 1 回だけ呼ばれているか
+    mock_bq.load_table_from_uri.assert_called_once()
+    args, kwargs = mock_bq.load_table_from_uri.call_args
+    assert args[0] == [
+        "gs://dummy-bucket/day1.ndjson",
+        "gs://dummy-bucket/day2.ndjson",
+    ]
+
+
+@mock.patch("utils.etl.load_to_bigquery.bigquery.Client")
+@mock.patch("utils.etl.load_to_bigquery.storage.Client")
+def test_load_temp_table_from_records_calls_load_from_json(
+    mock_storage_client, mock_bq_client
+):
+    """
+    load_temp_table_from_records() が GCS を経由せず load_table_from_json を呼び出すかを検証する。
+    """
+    mock_blob = mock.Mock()
+    mock_blob.download_as_text.return_value = (
+        '[{"name": "date", "field_type": "DATE"}]'
+    )
+    mock_storage_client.return_value.bucket.return_value.blob.return_value = (
+        mock_blob
+    )
+    mock_bq = mock.Mock()
+    mock_bq_client.return_value = mock_bq
+    records = [{"ticker_id": "AAPL", "date": "2025-08-01"}]
+
+    # 実行
+    temp_table_id = load_temp_table_from_records(
+        records=records,
+        bucket_name="dummy-bucket",
+        dataset_id="dummy_dataset",
+        table_id="dummy_table",
+        schema_blob_path="schema/stock_prices_schema.json",
+    )
+
+    # 検証：レコードがそのままロードされ、GCS URI からのロードは行われないこと
+    mock_bq.load_table_from_json.assert_called_once()
+    mock_bq.load_table_from_uri.assert_not_called()
+    args, kwargs = mock_bq.load_table_from_json.call_args
+    assert args[0] == records
+    assert temp_table_id.startswith("dummy_table_temp_")
+
+
+@mock.patch("utils.etl.load_to_bigquery.bigquery.Client")
+@mock.patch("utils.etl.load_to_bigquery.storage.Client")
+def test_load_temp_table_downloads_schema_once(
+    mock_storage_client, mock_bq_client
+):
+    """
+    同じスキーマ定義で load_temp_table() を複数回呼んでも、GCS からの取得は 1 回だけかを検証する。
+    """
+    mock_blob = mock.Mock()
+    mock_blob.download_as_text.return_value = (
+        '[{"name": "date", "field_type": "DATE"}]'
+    )
+    mock_storage_client.return_value.bucket.return_value.blob.return_value = (
+        mock_blob
+    )
+    mock_bq_client.return_value = mock.Mock()
+
+    # 実行
+    for path in ["day1.ndjson", "day2.ndjson"]:
+        load_temp_table(
+            bucket_name="dummy-bucket",
+            json_path=path,
+            dataset_id="dummy_dataset",
+            table_id="dummy_table",
+            schema_blob_path="schema/stock_prices_schema.json",
+        )
+
+    # 検証：スキーマ定義のダウンロードは 1 回のみ
+    mock_blob.download_as_text.assert_called_once()
+
+
+@mock.patch("utils.etl.load_to_bigquery.bigquery.Client")
+@mock.patch("utils.etl.load_to_bigquery.storage.Client")
+def test_load_temp_table_without_schema_uses_autodetect(
+    mock_storage_client, mock_bq_client
+):
+    """
+    スキーマ定義ファイルを指定しない場合、GCS を参照せず自動検出でロードするかを検証する。
+    """
+    mock_bq = mock.Mock()
+    mock_bq_client.return_value = mock_bq
+
+    # 実行
+    load_temp_table(
+        bucket_name="dummy-bucket",
+        json_path="dummy.ndjson",
+        dataset_id="dummy_dataset",
+        table_id="dummy_table",
+    )
+
+    # 検証：スキーマ取得は行われず、autodetect が有効になっているか
+    mock_storage_client.assert_not_called()
+    job_config = mock_bq.load_table_from_uri.call_args.kwargs["job_config"]
+    assert job_config.autodetect is True
+
+@mock.patch("utils.etl.load_to_bigquery.BigQueryWriteClient")
+@mock.patch("utils.etl.load_to_bigquery.bigquery.Client")
+@mock.patch("utils.etl.load_to_bigquery.storage.Client")
+def test_load_temp_table_via_storage_write_api_commits_pending_stream(
+    mock_storage_client, mock_bq_client, mock_write_client
+):
+    """
+    load_temp_table_via_storage_write_api() が PENDING ストリームに追記し、コミットまで行うかを検証する。
+    """
+    mock_blob = mock.Mock()
+    mock_blob.download_as_text.return_value = (
+        '[{"name": "ticker_id", "field_type": "STRING"},'
+        ' {"name": "date", "field_type": "DATE"},'
+        ' {"name": "close_price", "field_type": "FLOAT"}]'
+    )
+    mock_storage_client.return_value.bucket.return_value.blob.return_value = (
+        mock_blob
+    )
+    mock_bq = mock.Mock()
+    mock_bq.project = "dummy_project"
+    mock_bq_client.return_value = mock_bq
+    mock_writer = mock_write_client.return_value
+    mock_writer.table_path.return_value = "dummy_table_path"
+    mock_writer.create_write_stream.return_value.name = "dummy_stream"
+    mock_writer.batch_commit_write_streams.return_value.stream_errors = []
+
+    # append_rows に渡されたリクエストを消費して記録する
+    sent_requests = []
+
+    def fake_append_rows(requests):
+        sent_requests.extend(requests)
+        return [mock.Mock(**{"error.code": 0})]
+
+    mock_writer.append_rows.side_effect = fake_append_rows
+    records = [
+        {"ticker_id": "AAPL", "date": "2025-08-01", "close_price": 105.0},
+        {"ticker_id": "MSFT", "date": "2025-08-01", "close_price": 201.0},
+    ]
+
+    # 実行
+    temp_table_id = load_temp_table_via_storage_write_api(
+        records=records,
+        bucket_name="dummy-bucket",
+        dataset_id="dummy_dataset",
+        table_id="dummy_table",
+        schema_blob_path="schema/stock_prices_schema.json",
+    )
+
+    # 検証：一時テーブル作成 → 追記 → 確定 → コミットの順に呼ばれているか
+    assert temp_table_id.startswith("dummy_table_temp_")
+    mock_bq.create_table.assert_called_once()
+    assert len(sent_requests) == 1
+    assert sent_requests[0].write_stream == "dummy_stream"
+    assert len(sent_requests[0].proto_rows.rows.serialized_rows) == 2
+    mock_writer.finalize_write_stream.assert_called_once_with(
+        name="dummy_stream"
+    )
+    mock_writer.batch_commit_write_streams.assert_called_once()
+
+
 @mock.patch("utils.etl.load_to_bigquery.bigquery.Client")
 def test_merge_temp_table_to_bq_executes_merge_sql(mock_bq_client):
     """
@@ -75,6 +265,28 @@ def test_merge_temp_table_to_bq_executes_merge_sql(mock_bq_client):
     assert "MERGE" in mock_client.query.call_args[0][0]
 
 
+@mock.patch("utils.etl.load_to_bigquery.bigquery.Client")
+def test_merge_temp_table_to_bq_with_date_range(mock_bq_client):
+    """
+    merge_temp_table_to_bq() に期間を渡した場合、日付条件とクエリパラメータが付与されるかを検証する。
+    """
+    mock_client = mock.Mock()
+    mock_client.project = "dummy_project"
+    mock_bq_client.return_value = mock_client
+
+    # 実行
+    merge_temp_table_to_bq(
+        "dummy_temp_table", start_date="2025-08-01", end_date="2025-08-02"
+    )
+
+    # 検証：ON句に期間条件が入り、パラメータとして日付が渡されているか
+    sql = mock_client.query.call_args[0][0]
+    job_config = mock_client.query.call_args.kwargs["job_config"]
+    assert "T.date BETWEEN @start_date AND @end_date" in sql
+    params = {p.name: str(p.value) for p in job_config.query_parameters}
+    assert params == {"start_date": "2025-08-01", "end_date": "2025-08-02"}
+
+
 @mock.patch("utils.etl.load_to_bigquery.bigquery.Client")
 def test_delete_temp_table_executes_delete(mock_bq_client):
     """
@@ -1,15 +1,18 @@
 """
 pipeline モジュールのテスト
 
-- run_extract_pipeline()：最新データのETLフローが正しく呼び出されるか
-- run_extract_range_pipeline()：日付範囲指定のETLフローが正しく繰り返されるか
+- run_extract_pipeline()：最新データのETLフローが正しく呼び出されるか（件数に応じたロード経路の選択を含む）
+- run_extract_range_pipeline()：日付範囲指定のETLフローが1回のロード／MERGEにまとめられるか（保存失敗時の中断を含む）
 - GCS保存／BQロード／マージ／変換／通知までの呼び出し確認（Mockを使用）
 """
 
 from unittest import mock
+
+import pytest
 from utils.pipeline import run_extract_pipeline, run_extract_range_pipeline
 
 
+@mock.patch("utils.pipeline.DIRECT_LOAD_MAX_ROWS", 0)
 @mock.patch("utils.pipeline.notify_slack")
 @mock.patch("utils.pipeline.log_to_gcs")
 @mock.patch("utils.pipeline.transform_to_analytics_table")
@@ -32,6 +35,7 @@ def test_run_extract_pipeline(
 ):
     """
     run_extract_pipeline() が ETL処理の各ステップを 1 回ずつ呼び出すかを検証する。
+    （GCS経由のロード経路）
     """
     test_tickers = ["AAPL", "MSFT"]
 
@@ -84,8 +88,65 @@ def test_run_extract_pipeline(
 @mock.patch("utils.pipeline.transform_to_analytics_table")
 @mock.patch("utils.pipeline.delete_temp_table")
 @mock.patch("utils.pipeline.merge_temp_table_to_bq")
+@mock.patch("utils.pipeline.load_temp_table_from_records")
 @mock.patch("utils.pipeline.load_temp_table")
 @mock.patch("utils.pipeline.save_json_to_gcs")
+@mock.patch("utils.pipeline.format_stock_prices")
+@mock.patch("utils.pipeline.fetch_stock_prices_latest")
+def test_run_extract_pipeline_small_batch_skips_gcs(
+    mock_fetch,
+    mock_format,
+    mock_save,
+    mock_load,
+    mock_load_records,
+    mock_merge,
+    mock_delete,
+    mock_transform,
+    mock_log,
+    mock_notify,
+):
+    """
+    件数が少ない場合、GCS保存を省いて直接ロードする経路が選ばれるかを検証する。
+    """
+    dummy_format = [
+        {
+            "ticker_id": "AAPL",
+            "date": "2025-08-01",
+            "open_price": 100,
+            "high_price": 110,
+            "low_price": 90,
+            "close_price": 105,
+            "volume": 100000,
+        }
+    ]
+    mock_fetch.return_value = [{"ticker": "AAPL"}]
+    mock_format.return_value = (dummy_format, "2025-08-01")
+    mock_load_records.return_value = "stock_prices_temp_dummy"
+
+    # 実行
+    run_extract_pipeline(["AAPL"])
+
+    # GCS保存・GCS経由のロードは行われず、直接ロード → マージされること
+    mock_save.assert_not_called()
+    mock_load.assert_not_called()
+    mock_load_records.assert_called_once()
+    assert mock_load_records.call_args.kwargs["records"] == dummy_format
+    mock_merge.assert_called_once_with(
+        "stock_prices_temp_dummy",
+        start_date="2025-08-01",
+        end_date="2025-08-01",
+    )
+    mock_delete.assert_called_once()
+    mock_transform.assert_called_once()
+
+
+@mock.patch("utils.pipeline.notify_slack")
+@mock.patch("utils.pipeline.log_to_gcs")
+@mock.patch("utils.pipeline.transform_to_analytics_table")
+@mock.patch("utils.pipeline.delete_temp_table")
+@mock.patch("utils.pipeline.merge_temp_table_to_bq")
+@mock.patch("utils.pipeline.load_temp_table")
+@mock.patch("utils.pipeline.save_json_to_gcs_by_date")
 @mock.patch("utils.pipeline.format_stock_prices_by_date")
 @mock.patch("utils.pipeline.fetch_stock_prices_by_date_range")
 def test_run_extract_range_pipeline(
@@ -100,7 +161,7 @@ def test_run_extract_range_pipeline(
     mock_notify,
 ):
     """
-    run_extract_range_pipeline() が 各日付ごとに ETL 処理を繰り返すかを検証する。
+    run_extract_range_pipeline() が 日付ごとに GCS 保存し、ロード／MERGE を 1 回にまとめるかを検証する。
     """
     tickers = ["AAPL"]
     start_date = "2025-08-01"
@@ -167,14 +228,106 @@ def test_run_extract_range_pipeline(
     # fetch関数が正しく呼ばれているか
     mock_fetch.assert_called_once_with(tickers, start_date, end_date)
 
-    # 日付単位の処理回数を確認
+    # GCS保存・ロード・マージ・削除は全日付で各 1 回
     assert mock_format.call_count == 1
-    assert mock_save.call_count == 2
-    assert mock_load.call_count == 2
-    assert mock_merge.call_count == 2
-    assert mock_delete.call_count == 2
+    mock_save.assert_called_once_with(
+        "yfinance-project-bucket", dummy_format
+    )
+    mock_load.assert_called_once()
+    mock_merge.assert_called_once()
+    mock_delete.assert_called_once()
+    assert mock_merge.call_args.kwargs == {
+        "start_date": "2025-08-01",
+        "end_date": "2025-08-02",
+    }
+    assert mock_load.call_args.kwargs["json_path"] == [
+        "fact/stock_prices_2025-08-01.ndjson",
+        "fact/stock_prices_2025-08-02.ndjson",
+    ]
 
     # 最後の変換・ログ・通知処理は1回ずつ
     mock_transform.assert_called_once()
     mock_log.assert_called_once()
     mock_notify.assert_called_once()
+
+
+@mock.patch("utils.pipeline.STORAGE_WRITE_MIN_ROWS", 0)
+@mock.patch("utils.pipeline.notify_slack")
+@mock.patch("utils.pipeline.log_to_gcs")
+@mock.patch("utils.pipeline.transform_to_analytics_table")
+@mock.patch("utils.pipeline.delete_temp_table")
+@mock.patch("utils.pipeline.merge_temp_table_to_bq")
+@mock.patch("utils.pipeline.load_temp_table_via_storage_write_api")
+@mock.patch("utils.pipeline.load_temp_table")
+@mock.patch("utils.pipeline.save_json_to_gcs_by_date")
+@mock.patch("utils.pipeline.format_stock_prices_by_date")
+@mock.patch("utils.pipeline.fetch_stock_prices_by_date_range")
+def test_run_extract_range_pipeline_large_batch_uses_storage_write(
+    mock_fetch,
+    mock_format,
+    mock_save,
+    mock_load,
+    mock_write,
+    mock_merge,
+    mock_delete,
+    mock_transform,
+    mock_log,
+    mock_notify,
+):
+    """
+    run_extract_range_pipeline() が 件数の多い場合に Storage Write API 経由で書き込むかを検証する。
+    """
+    dummy_format = {
+        "2025-08-01": [{"ticker_id": "AAPL", "date": "2025-08-01"}],
+        "2025-08-02": [{"ticker_id": "AAPL", "date": "2025-08-02"}],
+    }
+    mock_fetch.return_value = [{"ticker": "AAPL"}]
+    mock_format.return_value = dummy_format
+    mock_write.return_value = "stock_prices_temp_dummy"
+
+    # 実行
+    run_extract_range_pipeline(["AAPL"], "2025-08-01", "2025-08-02")
+
+    # 検証：全日付分のレコードを 1 回で書き込み、ロードジョブは使わない
+    mock_load.assert_not_called()
+    mock_write.assert_called_once()
+    assert mock_write.call_args.kwargs["records"] == [
+        {"ticker_id": "AAPL", "date": "2025-08-01"},
+        {"ticker_id": "AAPL", "date": "2025-08-02"},
+    ]
+    mock_merge.assert_called_once_with(
+        "stock_prices_temp_dummy",
+        start_date="2025-08-01",
+        end_date="2025-08-02",
+    )
+    mock_delete.assert_called_once()
+
+
+@mock.patch("utils.pipeline.notify_slack")
+@mock.patch("utils.pipeline.log_to_gcs")
+@mock.patch("utils.pipeline.load_temp_table")
+@mock.patch("utils.pipeline.save_json_to_gcs_by_date")
+@mock.patch("utils.pipeline.format_stock_prices_by_date")
+@mock.patch("utils.pipeline.fetch_stock_prices_by_date_range")
+def test_run_extract_range_pipeline_stops_when_save_fails(
+    mock_fetch,
+    mock_format,
+    mock_save,
+    mock_load,
+    mock_log,
+    mock_notify,
+):
+    """
+    run_extract_range_pipeline() が GCS保存が失敗した場合に、ロードへ進まず例外を送出するかを検証する。
+    """
+    mock_fetch.return_value = [{"ticker": "AAPL"}]
+    mock_format.return_value = {
+        "2025-08-01": [{"ticker_id": "AAPL", "date": "2025-08-01"}],
+        "2025-08-02": [{"ticker_id": "AAPL", "date": "2025-08-02"}],
+    }
+    mock_save.side_effect = RuntimeError("upload failed")
+
+    # 実行・検証：例外が送出され、ロードは呼ばれない
+    with pytest.raises(RuntimeError):
+        run_extract_range_pipeline(["AAPL"], "2025-08-01", "2025-08-02")
+    mock_load.assert_not_called()
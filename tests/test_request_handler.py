@@ -0,0 +1,48 @@
+"""
+request_handler モジュールのテスト
+
+- mode に応じて対応するパイプライン処理が呼び出されるか
+- 不正な mode の場合に ValueError となるか
+"""
+
+from unittest import mock
+
+import pytest
+from handlers.request_handler import handle_request
+
+
+@mock.patch("handlers.request_handler.run_extract_range_pipeline")
+@mock.patch("handlers.request_handler.run_extract_pipeline")
+def test_handle_request_dispatches_etl(mock_etl, mock_etl_range):
+    """
+    mode=etl の場合、run_extract_pipeline() のみが呼ばれるかを検証する。
+    """
+    handle_request(mode="etl", tickers=["AAPL"])
+
+    mock_etl.assert_called_once_with(["AAPL"])
+    mock_etl_range.assert_not_called()
+
+
+@mock.patch("handlers.request_handler.run_extract_range_pipeline")
+def test_handle_request_dispatches_etl_range(mock_etl_range):
+    """
+    mode=etl_range の場合、日付範囲を渡して呼び出されるかを検証する。
+    """
+    handle_request(
+        mode="etl_range",
+        tickers=["AAPL"],
+        start_date="2025-08-01",
+        end_date="2025-08-02",
+    )
+
+    mock_etl_range.assert_called_once_with(
+        ["AAPL"], "2025-08-01", "2025-08-02"
+    )
+
+
+def test_handle_request_invalid_mode_raises():
+    """
+    未対応の mode が指定された場合に ValueError となるかを検証する。
+    """
+    with pytest.raises(ValueError):
+        handle_request(mode="unknown")
@@ -1,13 +1,20 @@
 """
-save_json_to_gcs() のテストモジュール
+save_json_to_gcs() / save_json_to_gcs_by_date() のテストモジュール
 
 - GCS クライアントをモック化して、実際のクラウド操作を伴わずに検証
 - モックを通じて storage.Client → bucket → blob → upload の一連の呼び出しが行われたか確認
 - アップロードされた内容が JSON 文字列またはバイト列であることを検証
+- 複数日分の保存で、クライアントが日付ごとに再生成されないことを検証
+- 並列アップロードの一部が失敗しても、他の日付は保存され例外が送出されることを検証
 """
 
 from unittest import mock
-from utils.etl.save_json_to_gcs import save_json_to_gcs
+
+import pytest
+from utils.etl.save_json_to_gcs import (
+    save_json_to_gcs,
+    save_json_to_gcs_by_date,
+)
 
 
 @mock.patch("utils.etl.save_json_to_gcs.storage.Client")
@@ -40,3 +47,51 @@ def test_save_json_to_gcs_success(mock_storage_client):
     assert isinstance(
         args[0], (str, bytes)
     ), "GCSにアップロードされるデータが文字列またはバイト列である必要があります"
+
+
+@mock.patch("utils.etl.save_json_to_gcs.storage.Client")
+def test_save_json_to_gcs_by_date_reuses_client(mock_storage_client):
+    """
+    save_json_to_gcs_by_date() が 1 つのクライアントで全日付分をアップロードするかを検証する。
+    """
+    mock_bucket = mock_storage_client.return_value.bucket.return_value
+    grouped = {
+        "2025-08-01": [{"ticker_id": "AAPL", "date": "2025-08-01"}],
+        "2025-08-02": [{"ticker_id": "AAPL", "date": "2025-08-02"}],
+    }
+
+    # 実行
+    save_json_to_gcs_by_date("dummy-bucket", grouped)
+
+    # 検証：クライアント生成は 1 回、アップロードは日付ごと
+    mock_storage_client.assert_called_once()
+    assert sorted(c.args[0] for c in mock_bucket.blob.call_args_list) == [
+        "fact/stock_prices_2025-08-01.ndjson",
+        "fact/stock_prices_2025-08-02.ndjson",
+    ]
+    assert mock_bucket.blob.return_value.upload_from_string.call_count == 2
+
+
+@mock.patch("utils.etl.save_json_to_gcs.storage.Client")
+def test_save_json_to_gcs_by_date_raises_after_all_uploads(
+    mock_storage_client,
+):
+    """
+    save_json_to_gcs_by_date() が 一部の失敗時も残りの日付をアップロードし、最後に例外を送出するかを検証する。
+    """
+    mock_bucket = mock_storage_client.return_value.bucket.return_value
+    failing_blob = mock.Mock()
+    failing_blob.upload_from_string.side_effect = RuntimeError("failed")
+    ok_blob = mock.Mock()
+    mock_bucket.blob.side_effect = lambda name: (
+        failing_blob if name.endswith("2025-08-01.ndjson") else ok_blob
+    )
+    grouped = {
+        "2025-08-01": [{"ticker_id": "AAPL", "date": "2025-08-01"}],
+        "2025-08-02": [{"ticker_id": "AAPL", "date": "2025-08-02"}],
+    }
+
+    # 実行・検証：例外は送出されるが、失敗していない日付は保存されている
+    with pytest.raises(RuntimeError):
+        save_json_to_gcs_by_date("dummy-bucket", grouped)
+    ok_blob.upload_from_string.assert_called_once()
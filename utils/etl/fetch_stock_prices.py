@@ -10,16 +10,28 @@ yfinance から株価データを取得するモジュール。
 # utils/etl/fetch_stock_prices.py
 
 # --- 標準ライブラリ ---
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 # --- サードパーティ ---
+import pandas as pd
 import yfinance as yf
 
 # --- ロガー設定 ---
 logger = logging.getLogger(__name__)
 
+# --- 定数 ---
+MAX_FETCH_WORKERS = 16  # 銘柄ごとの代替取得時に同時実行するスレッド数
+OHLCV_DTYPES = {
+    "Open": "float64",
+    "High": "float64",
+    "Low": "float64",
+    "Close": "float64",
+    "Volume": "int64",
+}
+
 # ----------------------------
 # 補助関数
 # ----------------------------
@@ -33,6 +45,65 @@ def get_yesterday_date_str() -> str:
     return (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
 
 
+def _iter_records(
+    ticker: str, df: pd.DataFrame, now: str
+) -> Iterator[Dict[str, Any]]:
+    """
+    1銘柄分の株価 DataFrame を dict のレコードとして1件ずつ返す。
+    列ごとに NumPy 配列として取り出し、zip で1行1dictに組み立てる。
+    日付は DatetimeIndex 全体を一括で YYYY-MM-DD 文字列に変換する。
+    呼び出し側の結果リストへ直接展開し、銘柄ごとの中間リストを作らない。
+
+    - yield: "ticker", "date", "Open" 等を含むレコード
+    """
+    dates = df.index.strftime("%Y-%m-%d").tolist()
+    opens, highs, lows, closes, volumes = (
+        df[col].to_numpy(dtype=dtype).tolist()
+        for col, dtype in OHLCV_DTYPES.items()
+    )
+    for d, o, h, lo, c, v in zip(dates, opens, highs, lows, closes, volumes):
+        yield {
+            "ticker": ticker,
+            "date": d,
+            "Open": o,
+            "High": h,
+            "Low": lo,
+            "Close": c,
+            "Volume": v,
+            "created_at": now,
+        }
+
+
+def _fetch_one(
+    ticker: str, start: str, end_for_fetch: str, date_label: str, now: str
+) -> List[Dict[str, Any]]:
+    """
+    1銘柄分の株価を yf.Ticker().history() で取得する（一括取得が失敗した場合の代替経路）。
+    例外はここで握りつぶし、他の銘柄の取得を止めないようにする。
+    """
+    try:
+        df = yf.Ticker(ticker).history(start=start, end=end_for_fetch)
+
+        # データが取得できなかった場合はスキップ
+        if df.empty:
+            logger.info(
+                f"[info] fetch_stock_prices: [{ticker}] No data available for {date_label}."
+            )
+            return []
+
+        records = list(_iter_records(ticker, df, now))
+        logger.info(
+            f"[success] fetch_stock_prices: [{ticker}] Successfully fetched data for {date_label}."
+        )
+        return records
+
+    except Exception as e:
+        logger.error(
+            f"[error] fetch_stock_prices: [{ticker}] Failed to fetch stock data for {date_label}. Error: {str(e)}"
+        )
+        return []
+
+
 # ----------------------------
 # メイン取得関数（内部用）
 # ----------------------------
@@ -43,6 +114,8 @@ def fetch_stock_prices(
 ) -> List[Dict[str, Any]]:
     """
     指定した日付範囲における株価データを yfinance から取得し、整形して返す。
+    全銘柄を yf.download でまとめて取得し、銘柄ごとに切り出してレコード化する。
+    一括取得自体が失敗した場合は、銘柄ごとの取得をスレッドで並列実行する。
 
     - start: 取得開始日（YYYY-MM-DD）
     - end:   取得終了日（YYYY-MM-DD, 当日含む）
@@ -58,34 +131,64 @@ def fetch_stock_prices(
         else f"{start} ~ {end_for_display}"
     )
     fetch_results = []
+    now = datetime.now(timezone.utc).isoformat()
+
+    logger.info(
+        f"[start] fetch_stock_prices: Fetching stock data for {len(tickers)} tickers ({date_label})..."
+    )
+
+    # 全銘柄を1回のリクエストでまとめて取得（yfinance 内部のスレッドで並列化）
+    try:
+        df = yf.download(
+            tickers,
+            start=start,
+            end=end_for_fetch,
+            group_by="ticker",
+            threads=True,
+            auto_adjust=True,
+            progress=False,
+        )
+    except Exception as e:
+        logger.warning(
+            f"[warning] fetch_stock_prices: Batch download failed for {date_label}. Falling back to per-ticker fetch. Error: {str(e)}"
+        )
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+            for records in executor.map(
+                lambda t: _fetch_one(t, start, end_for_fetch, date_label, now),
+                tickers,
+            ):
+                fetch_results.extend(records)
+        return fetch_results
+
+    if df is None or df.empty:
+        logger.info(
+            f"[info] fetch_stock_prices: No data available for {date_label}."
+        )
+        return fetch_results
+
+    # 単一銘柄で列がフラットな場合は、銘柄レベルを付与して複数銘柄と同じ形に揃える
+    if not isinstance(df.columns, pd.MultiIndex):
+        df = pd.concat({tickers[0]: df}, axis=1)
+
+    fetched_tickers = set(df.columns.get_level_values(0))
 
     for ticker in tickers:
         try:
-            logger.info(
-                f"[start] fetch_stock_prices: [{ticker}] Fetching stock data for {date_label}..."
+            sub = (
+                df[ticker].dropna(how="all")
+                if ticker in fetched_tickers
+                else None
             )
 
-            t = yf.Ticker(ticker)
-            df = t.history(start=start, end=end_for_fetch)
-
             # データが取得できなかった場合はスキップ
-            if df.empty:
+            if sub is None or sub.empty:
                 logger.info(
                     f"[info] fetch_stock_prices: [{ticker}] No data available for {date_label}."
                 )
                 continue
 
             # レコード整形
-            records = df.reset_index().to_dict(orient="records")
-            now = datetime.now(timezone.utc).isoformat()
-
-            for r in records:
-                r["ticker"] = ticker
-                r["date"] = r["Date"].isoformat()
-                r["created_at"] = now
-                del r["Date"]
-
-            fetch_results.extend(records)
+            fetch_results.extend(_iter_records(ticker, sub, now))
             logger.info(
                 f"[success] fetch_stock_prices: [{ticker}] Successfully fetched data for {date_label}."
             )
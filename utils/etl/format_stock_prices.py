@@ -10,15 +10,92 @@
 # utils/etl/format_stock_prices.py
 
 # --- 標準ライブラリ ---
-from collections import defaultdict
-from datetime import datetime, timedelta, timezone
-from typing import Any, DefaultDict, Dict, List, Tuple
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
 import logging
 
+# --- サードパーティ ---
+import pandas as pd
+
 # --- 定数 & ロガー ---
-JST = timezone(timedelta(hours=9))
+JST_OFFSET = timedelta(hours=9)  # JST は固定オフセット（夏時間なし）
 logger = logging.getLogger(__name__)
 
+# fetch結果の列名 → 整形後の列名
+COLUMN_MAPPING = {
+    "ticker": "ticker_id",
+    "Open": "open_price",
+    "High": "high_price",
+    "Low": "low_price",
+    "Close": "close_price",
+    "Volume": "volume",
+}
+COLUMN_DTYPES = {
+    "open_price": "float64",
+    "high_price": "float64",
+    "low_price": "float64",
+    "close_price": "float64",
+    "volume": "int64",
+}
+OUTPUT_COLUMNS = [
+    "ticker_id",
+    "date",
+    "open_price",
+    "high_price",
+    "low_price",
+    "close_price",
+    "volume",
+    "created_at",
+]
+
+
+# ----------------------------
+# 補助関数
+# ----------------------------
+
+
+def get_created_at_str() -> str:
+    """
+    現在時刻を JST 基準で文字列（YYYY-MM-DD HH:MM:SS）として返す。
+    ※ バッチ全体で同じ値を使うため、整形処理の開始時に1回だけ呼び出す。
+    ※ JST は固定オフセットのため、タイムゾーン変換ではなく加算で求める。
+    """
+    return (datetime.utcnow() + JST_OFFSET).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _to_formatted_frame(
+    fetch_results: List[Dict[str, Any]], created_at: str
+) -> pd.DataFrame:
+    """
+    fetch_results を DataFrame に変換し、列名・型・日付をまとめて整形する。
+
+    行ごとの Python ループではなく、列単位の一括処理で整形する。
+    """
+    df = pd.DataFrame(fetch_results)
+    df["date"] = df["date"].str.slice(0, 10)
+    df = df.rename(columns=COLUMN_MAPPING).astype(COLUMN_DTYPES)
+    df["created_at"] = created_at
+    return df[OUTPUT_COLUMNS]
+
+
+def _pack_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    整形済み DataFrame を列ごとの型付き配列に変換し、dict のリストに詰め直す。
+
+    float/int への変換は列単位（NumPy の tolist）でまとめて行い、
+    行ごとのセル変換（to_dict の汎用ボクシング）を避ける。
+    """
+    columns = [
+        df[col].to_numpy(dtype=COLUMN_DTYPES.get(col, object)).tolist()
+        for col in OUTPUT_COLUMNS
+    ]
+    return [dict(zip(OUTPUT_COLUMNS, row)) for row in zip(*columns)]
+
+
+# ----------------------------
+# 整形関数（ETLの呼び出し側で利用）
+# ----------------------------
+
 
 def format_stock_prices(
     fetch_results: List[Dict[str, Any]],
@@ -29,65 +106,48 @@ def format_stock_prices(
     - return: (整形済みリスト, 対象日付文字列)
     """
     logger.info("[start] format_stock_prices: Starting formatting process.")
-    formated_results = []
-    stock_date = None
-
-    for fetch_result in fetch_results:
-        date = fetch_result["date"][:10]
-        if not stock_date:
-            stock_date = date
-
-        formatted = {
-            "ticker_id": fetch_result["ticker"],
-            "date": date,
-            "open_price": float(fetch_result["Open"]),
-            "high_price": float(fetch_result["High"]),
-            "low_price": float(fetch_result["Low"]),
-            "close_price": float(fetch_result["Close"]),
-            "volume": int(fetch_result["Volume"]),
-            "created_at": datetime.now(timezone.utc)
-            .astimezone(JST)
-            .strftime("%Y-%m-%d %H:%M:%S"),
-        }
-
-        formated_results.append(formatted)
-        logger.info(
-            f"[success] format_stock_prices: [{formatted['ticker_id']}] Formatted data for {formatted['date']}."
-        )
+    if not fetch_results:
+        return [], None
 
-    return formated_results, stock_date
+    created_at = get_created_at_str()
+    df = _to_formatted_frame(fetch_results, created_at)
+    stock_date = df["date"].iat[0]
+
+    logger.info(
+        f"[success] format_stock_prices: Formatted {len(df)} records for {stock_date}."
+    )
+
+    return _pack_records(df), stock_date
 
 
 def format_stock_prices_by_date(
     fetch_results: List[Dict[str, Any]],
-) -> DefaultDict[str, List[Dict[str, Any]]]:
+) -> Dict[str, List[Dict[str, Any]]]:
     """
     fetch_results を日付ごとにグルーピングして整形する。
 
-    - return: {"日付文字列": [整形済レコード, ...]} の形式の辞書
+    日付順に並べ替えた DataFrame を1回だけレコード化し、
+    日付ごとの件数でスライスして各日のリストを切り出す（グループ単位の変換は行わない）。
+
+    - return: {"日付文字列": [整形済レコード, ...]} の形式の辞書（日付昇順）
     """
     logger.info(
         "[start] format_stock_prices_by_date: Starting daily formatting process."
     )
-    grouped = defaultdict(list)
-
-    for fetch_result in fetch_results:
-        date = fetch_result["date"][:10]
-
-        formatted = {
-            "ticker_id": fetch_result["ticker"],
-            "date": date,
-            "open_price": float(fetch_result["Open"]),
-            "high_price": float(fetch_result["High"]),
-            "low_price": float(fetch_result["Low"]),
-            "close_price": float(fetch_result["Close"]),
-            "volume": int(fetch_result["Volume"]),
-            "created_at": datetime.now(timezone.utc)
-            .astimezone(JST)
-            .strftime("%Y-%m-%d %H:%M:%S"),
-        }
-
-        grouped[date].append(formatted)
+    if not fetch_results:
+        return {}
+
+    created_at = get_created_at_str()
+    df = _to_formatted_frame(fetch_results, created_at).sort_values(
+        "date", kind="stable", ignore_index=True
+    )
+    records = _pack_records(df)
+
+    grouped = {}
+    start = 0
+    for date, count in df.groupby("date", sort=True).size().items():
+        grouped[date] = records[start : start + count]
+        start += count
 
     for date, records in grouped.items():
         logger.info(
@@ -2,6 +2,9 @@
 GCSからBigQueryへロードし、正規化テーブルへのマージ処理を行うモジュール。
 
 - 一時テーブルへのロード（load_temp_table）
+- 少量データの一時テーブルへの直接ロード（load_temp_table_from_records）
+- 大量データの Storage Write API による一時テーブルへの書き込み
+  （load_temp_table_via_storage_write_api）
 - 本テーブルへのMERGE（merge_temp_table_to_bq）
 - 一時テーブルの削除（delete_temp_table）
 """
@@ -12,13 +15,96 @@ GCSからBigQueryへロードし、正規化テーブルへのマージ処理を
 import json
 import logging
 import uuid
+from datetime import date, datetime, timezone
+from functools import lru_cache
 
 # --- サードパーティ ---
 from google.cloud import bigquery, storage
+from google.cloud.bigquery_storage_v1 import BigQueryWriteClient, types
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
 
 # --- ロガー設定 ---
 logger = logging.getLogger(__name__)
 
+# ----------------------------
+# クライアント取得（プロセス内で再利用）
+# ----------------------------
+
+
+@lru_cache(maxsize=1)
+def _get_bq_client() -> bigquery.Client:
+    """
+    BigQuery クライアントを生成し、以降の呼び出しでは同じインスタンスを返す。
+    ※ ウォームインスタンスで認証・接続の初期化を繰り返さないため。
+    """
+    return bigquery.Client()
+
+
+@lru_cache(maxsize=1)
+def _get_storage_client() -> storage.Client:
+    """
+    Cloud Storage クライアントを生成し、以降の呼び出しでは同じインスタンスを返す。
+    """
+    return storage.Client()
+
+
+@lru_cache(maxsize=1)
+def _get_write_client() -> BigQueryWriteClient:
+    """
+    BigQuery Storage Write API クライアントを生成し、以降の呼び出しでは同じインスタンスを返す。
+    """
+    return BigQueryWriteClient()
+
+
+# ----------------------------
+# スキーマ取得
+# ----------------------------
+
+
+@lru_cache(maxsize=8)
+def _fetch_schema(
+    bucket_name: str, schema_blob_path: str
+) -> tuple[bigquery.SchemaField, ...]:
+    """
+    GCS上のスキーマ定義JSONを取得し、BigQueryのスキーマ形式に変換する。
+    スキーマ定義は静的なファイルのため、(バケット, パス) ごとに変換結果をキャッシュする。
+    ※ キャッシュを共有するため不変の tuple で返す（呼び出し側で list に変換して使う）。
+
+    Args:
+        bucket_name (str): 対象のGCSバケット名
+        schema_blob_path (str): GCS上に保存されたスキーマ定義ファイル（JSON）
+
+    Returns:
+        tuple[bigquery.SchemaField, ...]: BigQueryのスキーマ定義
+    """
+    blob = _get_storage_client().bucket(bucket_name).blob(schema_blob_path)
+    schema_json = json.loads(blob.download_as_text())
+
+    return tuple(
+        bigquery.SchemaField(
+            field["name"], field["field_type"], field.get("mode", "NULLABLE")
+        )
+        for field in schema_json
+    )
+
+
+def _schema_options(bucket_name: str, schema_blob_path: str | None) -> dict:
+    """
+    ロードジョブに渡すスキーマ指定を返す。
+    スキーマ定義ファイルが指定されていない場合は自動検出とする（開発時の確認用）。
+
+    Args:
+        bucket_name (str): 対象のGCSバケット名
+        schema_blob_path (str | None): GCS上に保存されたスキーマ定義ファイル（JSON）
+
+    Returns:
+        dict: LoadJobConfig に渡すキーワード引数
+    """
+    if schema_blob_path is None:
+        return {"autodetect": True}
+    return {"schema": list(_fetch_schema(bucket_name, schema_blob_path))}
+
+
 # ----------------------------
 # 一時テーブルへのロード処理
 # ----------------------------
@@ -26,20 +112,23 @@ logger = logging.getLogger(__name__)
 
 def load_temp_table(
     bucket_name: str,
-    json_path: str,
+    json_path: str | list[str],
     dataset_id: str,
     table_id: str,
-    schema_blob_path: str,
+    schema_blob_path: str | None = None,
 ) -> str:
     """
     GCSのndjsonファイルを読み込み、一時テーブルとしてBigQueryにロードする。
+    複数ファイルを渡した場合は、1回のロードジョブでまとめて読み込む。
 
     Args:
         bucket_name (str): 対象のGCSバケット名
-        json_path (str): GCS内のndjsonファイルパス（例: fact/stock_prices_2025-08-04.ndjson）
+        json_path (str | list[str]): GCS内のndjsonファイルパス、またはそのリスト
+            （例: fact/stock_prices_2025-08-04.ndjson）
         dataset_id (str): BQのデータセットID
         table_id (str): メインテーブルID（例: stock_prices）
-        schema_blob_path (str): GCS上に保存されたスキーマ定義ファイル（JSON）
+        schema_blob_path (str | None): GCS上に保存されたスキーマ定義ファイル（JSON）
+            ※ 未指定の場合はスキーマを自動検出する（開発時のみ）
 
     Returns:
         str: 作成された一時テーブル名（例: stock_prices_temp_a1b2c3d4）
@@ -48,29 +137,23 @@ def load_temp_table(
         "[start] load_temp_table: Loading JSON from GCS into temporary BQ table."
     )
 
-    bq_client = bigquery.Client()
-    storage_client = storage.Client()
-
-    # GCSからスキーマJSONを取得 → BigQueryのスキーマ形式に変換
-    blob = storage_client.bucket(bucket_name).blob(schema_blob_path)
-    schema_json = json.loads(blob.download_as_text())
+    bq_client = _get_bq_client()
 
-    schema = []
-    for field in schema_json:
-        name = field["name"]
-        field_type = field["field_type"]
-        mode = field.get("mode", "NULLABLE")
-        schema.append(bigquery.SchemaField(name, field_type, mode))
+    # 読み込み元URI（複数ファイルの場合はリストのまま1ジョブに渡す）
+    if isinstance(json_path, str):
+        uri = f"gs://{bucket_name}/{json_path}"
+    else:
+        uri = [f"gs://{bucket_name}/{path}" for path in json_path]
 
     # 一時テーブル名の生成（UUIDでユニークに）
-    uri = f"gs://{bucket_name}/{json_path}"
     temp_table_id = f"{table_id}_temp_{uuid.uuid4().hex[:8]}"
     table_ref = f"{bq_client.project}.{dataset_id}.{temp_table_id}"
 
+    # スキーマ定義（キャッシュ済み）を指定
     job_config = bigquery.LoadJobConfig(
         source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
-        schema=schema,
         write_disposition="WRITE_TRUNCATE",
+        **_schema_options(bucket_name, schema_blob_path),
     )
 
     try:
@@ -89,6 +172,250 @@ def load_temp_table(
         raise
 
 
+def load_temp_table_from_records(
+    records: list[dict],
+    bucket_name: str,
+    dataset_id: str,
+    table_id: str,
+    schema_blob_path: str | None = None,
+) -> str:
+    """
+    整形済みレコードを GCS を経由せず、一時テーブルとしてBigQueryに直接ロードする。
+    件数の少ないバッチ向けの経路で、ロードジョブ（ストリーミング挿入ではない）を使う。
+
+    Args:
+        records (list[dict]): 整形済みの株価データ
+        bucket_name (str): スキーマ定義ファイルのあるGCSバケット名
+        dataset_id (str): BQのデータセットID
+        table_id (str): メインテーブルID（例: stock_prices）
+        schema_blob_path (str | None): GCS上に保存されたスキーマ定義ファイル（JSON）
+            ※ 未指定の場合はスキーマを自動検出する（開発時のみ）
+
+    Returns:
+        str: 作成された一時テーブル名（例: stock_prices_temp_a1b2c3d4）
+    """
+    logger.info(
+        f"[start] load_temp_table_from_records: Loading {len(records)} records into temporary BQ table."
+    )
+
+    bq_client = _get_bq_client()
+
+    # 一時テーブル名の生成（UUIDでユニークに）
+    temp_table_id = f"{table_id}_temp_{uuid.uuid4().hex[:8]}"
+    table_ref = f"{bq_client.project}.{dataset_id}.{temp_table_id}"
+
+    job_config = bigquery.LoadJobConfig(
+        write_disposition="WRITE_TRUNCATE",
+        **_schema_options(bucket_name, schema_blob_path),
+    )
+
+    try:
+        load_job = bq_client.load_table_from_json(
+            records, table_ref, job_config=job_config
+        )
+        load_job.result()
+        logger.info(
+            f"[success] load_temp_table_from_records: Temporary table created: {table_ref}"
+        )
+        return temp_table_id
+    except Exception as e:
+        logger.error(
+            f"[error] load_temp_table_from_records: Failed to create temporary table. Error: {str(e)}"
+        )
+        raise
+
+
+# ----------------------------
+# Storage Write API による一時テーブルへの書き込み
+# ----------------------------
+
+# 1リクエストあたりの行数（AppendRows の 10MB 制限に十分収まる件数）
+APPEND_ROWS_BATCH_SIZE = 10000
+
+_EPOCH_DATE = date(1970, 1, 1)
+_EPOCH_DATETIME = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_epoch_micros(value: str) -> int:
+    """
+    TIMESTAMP 文字列をエポックからのマイクロ秒に変換する。
+    ※ タイムゾーンなしの値は、ロードジョブと同様に UTC として扱う。
+    """
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH_DATETIME) // datetime.resolution
+
+
+# BigQuery の型 → (protobuf の型, 値の変換関数)
+_PROTO_TYPES = {
+    "STRING": (descriptor_pb2.FieldDescriptorProto.TYPE_STRING, str),
+    "INTEGER": (descriptor_pb2.FieldDescriptorProto.TYPE_INT64, int),
+    "FLOAT": (descriptor_pb2.FieldDescriptorProto.TYPE_DOUBLE, float),
+    "DATE": (
+        descriptor_pb2.FieldDescriptorProto.TYPE_INT32,
+        lambda v: (date.fromisoformat(v) - _EPOCH_DATE).days,
+    ),
+    "TIMESTAMP": (
+        descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+        _to_epoch_micros,
+    ),
+}
+
+
+def _build_row_descriptor(
+    schema: list[bigquery.SchemaField],
+) -> descriptor_pb2.DescriptorProto:
+    """
+    BigQuery のスキーマ定義から、1行分の protobuf メッセージ定義を組み立てる。
+    """
+    descriptor = descriptor_pb2.DescriptorProto(name="Row")
+    for number, field in enumerate(schema, start=1):
+        proto_type, _ = _PROTO_TYPES[field.field_type]
+        descriptor.field.add(
+            name=field.name,
+            number=number,
+            type=proto_type,
+            label=descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL,
+        )
+    return descriptor
+
+
+def _build_row_class(descriptor: descriptor_pb2.DescriptorProto) -> type:
+    """
+    メッセージ定義から、行をシリアライズするための protobuf クラスを生成する。
+    """
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name="stock_prices_row.proto", package="yfinance_etl"
+    )
+    file_proto.message_type.add().CopyFrom(descriptor)
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    return message_factory.GetMessageClass(
+        pool.FindMessageTypeByName("yfinance_etl.Row")
+    )
+
+
+def _iter_append_requests(
+    stream_name: str,
+    records: list[dict],
+    schema: list[bigquery.SchemaField],
+):
+    """
+    レコードを protobuf にシリアライズし、AppendRows リクエストとして順に返す。
+    先頭のリクエストにのみ書き込み先ストリームとスキーマを含める。
+    """
+    descriptor = _build_row_descriptor(schema)
+    row_class = _build_row_class(descriptor)
+    converters = [
+        (field.name, _PROTO_TYPES[field.field_type][1]) for field in schema
+    ]
+
+    for i in range(0, len(records), APPEND_ROWS_BATCH_SIZE):
+        proto_rows = types.ProtoRows()
+        for record in records[i : i + APPEND_ROWS_BATCH_SIZE]:
+            row = row_class(
+                **{
+                    name: convert(record[name])
+                    for name, convert in converters
+                    if record.get(name) is not None
+                }
+            )
+            proto_rows.serialized_rows.append(row.SerializeToString())
+
+        request = types.AppendRowsRequest(
+            proto_rows=types.AppendRowsRequest.ProtoData(rows=proto_rows)
+        )
+        if i == 0:
+            request.write_stream = stream_name
+            request.proto_rows.writer_schema = types.ProtoSchema(
+                proto_descriptor=descriptor
+            )
+        yield request
+
+
+def load_temp_table_via_storage_write_api(
+    records: list[dict],
+    bucket_name: str,
+    dataset_id: str,
+    table_id: str,
+    schema_blob_path: str,
+) -> str:
+    """
+    整形済みレコードを BigQuery Storage Write API で一時テーブルに書き込む。
+    大量データのバックフィル向けの経路で、ロードジョブの日次上限を消費しない。
+
+    PENDING ストリームに全件を追記し、最後にコミットすることで
+    全件が一括で反映される（途中で失敗した場合は何も反映されない）。
+
+    Args:
+        records (list[dict]): 整形済みの株価データ
+        bucket_name (str): スキーマ定義ファイルのあるGCSバケット名
+        dataset_id (str): BQのデータセットID
+        table_id (str): メインテーブルID（例: stock_prices）
+        schema_blob_path (str): GCS上に保存されたスキーマ定義ファイル（JSON）
+
+    Returns:
+        str: 作成された一時テーブル名（例: stock_prices_temp_a1b2c3d4）
+    """
+    logger.info(
+        f"[start] load_temp_table_via_storage_write_api: Writing {len(records)} records into temporary BQ table."
+    )
+
+    bq_client = _get_bq_client()
+    write_client = _get_write_client()
+    schema = list(_fetch_schema(bucket_name, schema_blob_path))
+
+    # 一時テーブル名の生成（UUIDでユニークに）
+    temp_table_id = f"{table_id}_temp_{uuid.uuid4().hex[:8]}"
+    table_ref = f"{bq_client.project}.{dataset_id}.{temp_table_id}"
+
+    try:
+        bq_client.create_table(bigquery.Table(table_ref, schema=schema))
+
+        parent = write_client.table_path(
+            bq_client.project, dataset_id, temp_table_id
+        )
+        write_stream = write_client.create_write_stream(
+            parent=parent,
+            write_stream=types.WriteStream(
+                type_=types.WriteStream.Type.PENDING
+            ),
+        )
+
+        # 全件を追記（レスポンスにエラーが含まれていれば中断）
+        responses = write_client.append_rows(
+            _iter_append_requests(write_stream.name, records, schema)
+        )
+        for response in responses:
+            if response.error.code:
+                raise RuntimeError(
+                    f"AppendRows failed: {response.error.message}"
+                )
+
+        # ストリームを確定し、テーブルへ一括で反映
+        write_client.finalize_write_stream(name=write_stream.name)
+        commit_response = write_client.batch_commit_write_streams(
+            types.BatchCommitWriteStreamsRequest(
+                parent=parent, write_streams=[write_stream.name]
+            )
+        )
+        if commit_response.stream_errors:
+            raise RuntimeError(
+                f"BatchCommitWriteStreams failed: {commit_response.stream_errors}"
+            )
+
+        logger.info(
+            f"[success] load_temp_table_via_storage_write_api: Temporary table created: {table_ref}"
+        )
+        return temp_table_id
+    except Exception as e:
+        logger.error(
+            f"[error] load_temp_table_via_storage_write_api: Failed to write temporary table. Error: {str(e)}"
+        )
+        raise
+
+
 # ----------------------------
 # MERGE設定（静的変数）
 # ----------------------------
@@ -116,6 +443,7 @@ def build_merge_sql(
     temp_table: str,
     key_cols: list[str],
     value_cols: list[str],
+    target_filter: str | None = None,
 ) -> str:
     """
     BigQueryのMERGE文を動的に生成する。
@@ -125,11 +453,15 @@ def build_merge_sql(
         temp_table (str): 一時テーブル（例: project.dataset.stock_prices_temp_xxxx）
         key_cols (list[str]): マッチ条件となるキー列（主キー）
         value_cols (list[str]): 更新・挿入対象のカラム
+        target_filter (str | None): 本テーブル側の絞り込み条件（ON句に AND で追加）
+            例: "T.date BETWEEN @start_date AND @end_date"
 
     Returns:
         str: 完成されたMERGE SQL文（マルチライン）
     """
     on_clause = " AND ".join([f"T.{col} = S.{col}" for col in key_cols])
+    if target_filter:
+        on_clause += f" AND {target_filter}"
     update_clause = ", ".join([f"{col} = S.{col}" for col in value_cols])
     insert_cols = key_cols + value_cols
     insert_cols_str = ", ".join(insert_cols)
@@ -146,30 +478,65 @@ def build_merge_sql(
     """
 
 
+# テーブル名以外は固定のため、MERGE文の雛形はインポート時に1回だけ組み立てる
+# ※ テーブル名はクエリパラメータにできないため、str.format で埋め込む
+_DATE_RANGE_FILTER = "T.date BETWEEN @start_date AND @end_date"
+_MERGE_SQL_TEMPLATE = build_merge_sql(
+    "{target_table}", "{temp_table}", KEY_COLS, VALUE_COLS
+)
+_MERGE_SQL_TEMPLATE_BY_DATE = build_merge_sql(
+    "{target_table}", "{temp_table}", KEY_COLS, VALUE_COLS, _DATE_RANGE_FILTER
+)
+
+
 # ----------------------------
 # MERGE実行
 # ----------------------------
 
 
-def merge_temp_table_to_bq(temp_table_id: str) -> None:
+def merge_temp_table_to_bq(
+    temp_table_id: str,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> None:
     """
     一時テーブルの内容を、本テーブルに対してMERGE（UPSERT）する。
 
+    start_date / end_date を指定した場合は、本テーブル側を該当期間に絞り込み、
+    date パーティションのプルーニングによりスキャン量を抑える。
+
     Args:
         temp_table_id (str): 一時テーブル名（load_temp_tableの戻り値）
+        start_date (str | None): 一時テーブルに含まれる最小日付（YYYY-MM-DD）
+        end_date (str | None): 一時テーブルに含まれる最大日付（YYYY-MM-DD）
     """
     logger.info(
         f"[start] merge_temp_table_to_bq: Starting merge of temp table {temp_table_id}."
     )
-    client = bigquery.Client()
+    client = _get_bq_client()
     project = client.project
     target_table = f"{project}.{DATASET_ID}.{MAIN_TABLE_ID}"
     temp_table = f"{project}.{DATASET_ID}.{temp_table_id}"
 
-    merge_sql = build_merge_sql(target_table, temp_table, KEY_COLS, VALUE_COLS)
+    job_config = None
+    template = _MERGE_SQL_TEMPLATE
+    if start_date and end_date:
+        template = _MERGE_SQL_TEMPLATE_BY_DATE
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter(
+                    "start_date", "DATE", start_date
+                ),
+                bigquery.ScalarQueryParameter("end_date", "DATE", end_date),
+            ]
+        )
+
+    merge_sql = template.format(
+        target_table=target_table, temp_table=temp_table
+    )
 
     try:
-        query_job = client.query(merge_sql)
+        query_job = client.query(merge_sql, job_config=job_config)
         query_job.result()
         logger.info(
             f"[success] merge_temp_table_to_bq: Merge completed. {temp_table_id} merged into {target_table}"
@@ -197,7 +564,7 @@ def delete_temp_table(temp_table_id: str, dataset_id: str) -> None:
     logger.info(
         f"[start] delete_temp_table: Deleting temp table {temp_table_id}."
     )
-    client = bigquery.Client()
+    client = _get_bq_client()
     full_id = f"{client.project}.{dataset_id}.{temp_table_id}"
 
     try:
@@ -9,15 +9,29 @@
 # utils/etl/save_json_to_gcs.py
 
 # --- 標準ライブラリ ---
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # --- サードパーティ ---
+import orjson
 from google.cloud import storage
 
 # --- ロガー設定 ---
 logger = logging.getLogger(__name__)
 
+# --- 定数 ---
+MAX_UPLOAD_WORKERS = 8  # 複数日分の保存で同時にアップロードするスレッド数
+
+
+@lru_cache(maxsize=1)
+def _get_storage_client() -> storage.Client:
+    """
+    Cloud Storage クライアントを生成し、以降の呼び出しでは同じインスタンスを返す。
+    ※ ウォームインスタンスで認証・接続の初期化を繰り返さないため。
+    """
+    return storage.Client()
+
 
 def save_json_to_gcs(bucket_name: str, formatted_results: list[dict]) -> None:
     """
@@ -43,18 +57,18 @@ def save_json_to_gcs(bucket_name: str, formatted_results: list[dict]) -> None:
         f"[start] save_json_to_gcs: Start uploading {len(formatted_results)} records to GCS."
     )
 
-    client = storage.Client()
+    client = _get_storage_client()
     bucket = client.bucket(bucket_name)
 
     # ファイル名を日付から決定
     stock_date = formatted_results[0]["date"]
     filename = f"fact/stock_prices_{stock_date}.ndjson"
 
-    # NDJSON形式へ変換
-    ndjson_lines = "\n".join(
-        json.dumps(r, ensure_ascii=False) for r in formatted_results
+    # NDJSON形式へ変換（orjson は UTF-8 の bytes を直接出力する）
+    data_bytes = b"\n".join(
+        orjson.dumps(r, option=orjson.OPT_SERIALIZE_NUMPY)
+        for r in formatted_results
     )
-    data_bytes = ndjson_lines.encode("utf-8")
 
     try:
         blob = bucket.blob(filename)
@@ -76,11 +90,46 @@ def save_json_to_gcs(bucket_name: str, formatted_results: list[dict]) -> None:
 # ----------------------------
 
 
+def _upload_one(
+    bucket: storage.Bucket, date_str: str, formatted_list: list[dict]
+) -> None:
+    """
+    1日分の株価データを NDJSON に変換し、GCS にアップロードする。
+
+    Args:
+        bucket (storage.Bucket): 保存先のバケット
+        date_str (str): 対象日付（YYYY-MM-DD）
+        formatted_list (list[dict]): 整形済みの株価データ（1日分）
+    """
+    filename = f"fact/stock_prices_{date_str}.ndjson"
+    data_bytes = b"\n".join(
+        orjson.dumps(r, option=orjson.OPT_SERIALIZE_NUMPY)
+        for r in formatted_list
+    )
+
+    try:
+        blob = bucket.blob(filename)
+        blob.upload_from_string(
+            data_bytes, content_type="application/x-ndjson"
+        )
+        logger.info(
+            f"[success] save_json_to_gcs_by_date: File saved to gs://{bucket.name}/{filename}"
+        )
+    except Exception as e:
+        logger.error(
+            f"[error] save_json_to_gcs_by_date: Failed to save {filename}. Error: {str(e)}"
+        )
+        raise
+
+
 def save_json_to_gcs_by_date(
     bucket_name: str, grouped_results: dict[str, list[dict]]
 ) -> None:
     """
     日付ごとにグループ化された株価データを NDJSON 形式で GCS に保存する。
+    アップロードは I/O 待ちが主のため、日付ごとにスレッドで並列実行する。
+    一部の日付が失敗しても他の日付のアップロードは最後まで行い、
+    全件の完了後に最初の例外を送出する。
 
     Args:
         bucket_name (str): GCSバケット名
@@ -93,28 +142,21 @@ def save_json_to_gcs_by_date(
         f"[start] save_json_to_gcs_by_date: Saving grouped results for {len(grouped_results)} dates."
     )
 
-    for date_str, formatted_list in grouped_results.items():
-        filename = f"fact/stock_prices_{date_str}.ndjson"
-        ndjson_lines = "\n".join(
-            json.dumps(r, ensure_ascii=False) for r in formatted_list
+    # クライアント・バケットは全日付で共有する（ループ内で再生成しない）
+    bucket = _get_storage_client().bucket(bucket_name)
+
+    with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor:
+        futures = [
+            executor.submit(_upload_one, bucket, date_str, formatted_list)
+            for date_str, formatted_list in grouped_results.items()
+        ]
+
+    errors = [f.exception() for f in futures if f.exception() is not None]
+    if errors:
+        logger.error(
+            f"[error] save_json_to_gcs_by_date: {len(errors)} of {len(futures)} uploads failed."
         )
-        data_bytes = ndjson_lines.encode("utf-8")
-
-        try:
-            client = storage.Client()
-            bucket = client.bucket(bucket_name)
-            blob = bucket.blob(filename)
-            blob.upload_from_string(
-                data_bytes, content_type="application/x-ndjson"
-            )
-            logger.info(
-                f"[success] save_json_to_gcs_by_date: File saved to gs://{bucket_name}/{filename}"
-            )
-        except Exception as e:
-            logger.error(
-                f"[error] save_json_to_gcs_by_date: Failed to save {filename}. Error: {str(e)}"
-            )
-            raise
+        raise errors[0]
 
 
 # ----------------------------
@@ -133,6 +175,5 @@ def file_exists(bucket_name: str, path: str) -> bool:
     Returns:
         bool: ファイルが存在する場合は True、存在しない場合は False
     """
-    storage_client = storage.Client()
-    bucket = storage_client.bucket(bucket_name)
+    bucket = _get_storage_client().bucket(bucket_name)
     return bucket.blob(path).exists()
@@ -16,6 +16,7 @@ import json
 import logging
 import sys
 from datetime import datetime
+from functools import lru_cache
 
 # --- サードパーティ ---
 from google.cloud import logging as cloud_logging
@@ -60,6 +61,15 @@ def setup_logger(name=__name__) -> logging.Logger:
 logger = setup_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_storage_client() -> storage.Client:
+    """
+    Cloud Storage クライアントを生成し、以降の呼び出しでは同じインスタンスを返す。
+    ※ ログ保存のたびに認証・接続の初期化を繰り返さないため。
+    """
+    return storage.Client()
+
+
 def log_to_gcs(payload: dict, bucket_name: str) -> None:
     """
     JSONログを GCS（Cloud Storage）に保存する。
@@ -81,7 +91,7 @@ def log_to_gcs(payload: dict, bucket_name: str) -> None:
     filename = f"logs/{date_path}/{time_str}_{status}.json"
 
     try:
-        client = storage.Client()
+        client = _get_storage_client()
         bucket = client.bucket(bucket_name)
         blob = bucket.blob(filename)
 
@@ -26,9 +26,14 @@ from utils.etl.format_stock_prices import (
     format_stock_prices,
     format_stock_prices_by_date,
 )
-from utils.etl.save_json_to_gcs import save_json_to_gcs
+from utils.etl.save_json_to_gcs import (
+    save_json_to_gcs,
+    save_json_to_gcs_by_date,
+)
 from utils.etl.load_to_bigquery import (
     load_temp_table,
+    load_temp_table_from_records,
+    load_temp_table_via_storage_write_api,
     merge_temp_table_to_bq,
     delete_temp_table,
 )
@@ -42,6 +47,8 @@ logger = logging.getLogger(__name__)
 # --- 定数 ---
 BUCKET_NAME = "yfinance-project-bucket"
 DATASET_ID = "yfinance_analytics"
+DIRECT_LOAD_MAX_ROWS = 5000  # この件数未満は GCS を経由せず直接ロードする
+STORAGE_WRITE_MIN_ROWS = 5000  # この件数を超える範囲ETLは Storage Write API で書き込む
 
 # ----------------------------
 # 最新日処理（単日ETL）
@@ -54,6 +61,7 @@ def run_extract_pipeline(tickers: List[str]) -> None:
 
     - yfinanceから最新データ取得
     - 整形 → GCS保存 → BQロード → マージ → 非正規化変換
+      （DIRECT_LOAD_MAX_ROWS 件未満の場合は GCS保存を省き、直接BQロード）
     - Slack通知 / GCSログ出力
 
     Args:
@@ -70,16 +78,35 @@ def run_extract_pipeline(tickers: List[str]) -> None:
             return
 
         formatted_results, stock_date = format_stock_prices(fetch_results)
-        save_json_to_gcs(BUCKET_NAME, formatted_results)
-
-        temp_table_id = load_temp_table(
-            bucket_name=BUCKET_NAME,
-            json_path=f"fact/stock_prices_{stock_date}.ndjson",
-            dataset_id=DATASET_ID,
-            table_id="stock_prices",
-            schema_blob_path="schema/stock_prices_schema.json",
+
+        # 件数に応じてロード経路を選択（少量なら GCS を経由しない）
+        if len(formatted_results) < DIRECT_LOAD_MAX_ROWS:
+            logger.info(
+                f"[info] run_extract_pipeline: {len(formatted_results)} records. Loading directly into BigQuery (route=direct)."
+            )
+            temp_table_id = load_temp_table_from_records(
+                records=formatted_results,
+                bucket_name=BUCKET_NAME,
+                dataset_id=DATASET_ID,
+                table_id="stock_prices",
+                schema_blob_path="schema/stock_prices_schema.json",
+            )
+        else:
+            logger.info(
+                f"[info] run_extract_pipeline: {len(formatted_results)} records. Loading via GCS (route=gcs)."
+            )
+            save_json_to_gcs(BUCKET_NAME, formatted_results)
+            temp_table_id = load_temp_table(
+                bucket_name=BUCKET_NAME,
+                json_path=f"fact/stock_prices_{stock_date}.ndjson",
+                dataset_id=DATASET_ID,
+                table_id="stock_prices",
+                schema_blob_path="schema/stock_prices_schema.json",
+            )
+
+        merge_temp_table_to_bq(
+            temp_table_id, start_date=stock_date, end_date=stock_date
         )
-        merge_temp_table_to_bq(temp_table_id)
         delete_temp_table(temp_table_id, DATASET_ID)
 
         transform_to_analytics_table()
@@ -102,7 +129,9 @@ def run_extract_range_pipeline(
     """
     日付範囲指定で株価のETLパイプラインを実行する。
 
-    - 複数日分の取得・整形・GCS保存・BQロード・マージ
+    - 複数日分の取得・整形・GCS保存（日別ファイル、並列アップロード）
+    - 全日付分をまとめて BQロード・マージ（ロード／MERGE は各1回）
+      （STORAGE_WRITE_MIN_ROWS 件を超える場合は Storage Write API で書き込み）
     - 分析テーブル作成
     - Slack通知 / GCSログ出力
 
@@ -124,18 +153,43 @@ def run_extract_range_pipeline(
 
         grouped_results = format_stock_prices_by_date(fetch_results)
 
-        for stock_date, daily_results in grouped_results.items():
-            save_json_to_gcs(BUCKET_NAME, daily_results)
-
+        # フェーズ1：日別ファイルとして GCS に保存（日付ごとに並列アップロード）
+        save_json_to_gcs_by_date(BUCKET_NAME, grouped_results)
+        json_paths = [
+            f"fact/stock_prices_{stock_date}.ndjson"
+            for stock_date in grouped_results
+        ]
+
+        # フェーズ2：全日付分を 1 回のロード・MERGE でまとめて反映
+        # ※ ワイルドカード URI は過去分のファイルまで読み込むため、対象日のパスを明示する
+        total_rows = sum(len(rows) for rows in grouped_results.values())
+        if total_rows > STORAGE_WRITE_MIN_ROWS:
+            logger.info(
+                f"[info] run_extract_range_pipeline: {total_rows} records. Writing via Storage Write API (route=storage_write)."
+            )
+            temp_table_id = load_temp_table_via_storage_write_api(
+                records=[
+                    row for rows in grouped_results.values() for row in rows
+                ],
+                bucket_name=BUCKET_NAME,
+                dataset_id=DATASET_ID,
+                table_id="stock_prices",
+                schema_blob_path="schema/stock_prices_schema.json",
+            )
+        else:
             temp_table_id = load_temp_table(
                 bucket_name=BUCKET_NAME,
-                json_path=f"fact/stock_prices_{stock_date}.ndjson",
+                json_path=json_paths,
                 dataset_id=DATASET_ID,
                 table_id="stock_prices",
                 schema_blob_path="schema/stock_prices_schema.json",
             )
-            merge_temp_table_to_bq(temp_table_id)
-            delete_temp_table(temp_table_id, DATASET_ID)
+        merge_temp_table_to_bq(
+            temp_table_id,
+            start_date=min(grouped_results),
+            end_date=max(grouped_results),
+        )
+        delete_temp_table(temp_table_id, DATASET_ID)
 
         transform_to_analytics_table()
 